@@ -0,0 +1,51 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from wnm_sharepoint_client.async_client import AsyncSharePointClient
+from wnm_sharepoint_client.client import SharePointClient
+
+FOLDER = "General/AIBS Completed SWC Files/wnm_sharepoint_client_CICD"
+
+
+def test_invalid_site_name():
+    with pytest.raises(ValueError):
+        AsyncSharePointClient("NOT_A_REAL_SITE")
+
+
+def test_list_items():
+    async def run():
+        async with AsyncSharePointClient("HORTA") as client:
+            return await client.list_items(FOLDER)
+
+    listed_files = asyncio.run(run())
+    assert "test_json.json" in listed_files
+
+
+def test_read_json_round_trip():
+    current_time = datetime.now().isoformat()
+    file_name = "test_async_json.json"
+
+    with SharePointClient("HORTA") as sync_client:
+        sync_client.upload_json({"test_time": current_time}, FOLDER, file_name)
+
+    async def run():
+        async with AsyncSharePointClient("HORTA") as client:
+            return await client.read_json(FOLDER, file_name)
+
+    downloaded = asyncio.run(run())
+    assert downloaded["test_time"] == current_time
+
+
+def test_get_documents():
+    pairs = [(FOLDER, "test_json.json"), (FOLDER, "test_csv.csv")]
+
+    async def run():
+        async with AsyncSharePointClient("HORTA") as client:
+            return await client.get_documents(pairs)
+
+    docs = asyncio.run(run())
+    assert [d["name"] for d in docs] == ["test_json.json", "test_csv.csv"]
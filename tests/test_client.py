@@ -50,7 +50,7 @@ def test_move_file(client):
     if moved_file_name in source_files_og:
         moved_file_meta = client.get_document(FOLDER, moved_file_name)
         moved_file_id = moved_file_meta["id"]
-        delete_url = f"https://graph.microsoft.com/v1.0/sites/{client.site_id}/drives/{client.drive_id}/items/{moved_file_id}"
+        delete_url = client._items_prefix + moved_file_id
         headers = token_manager.get_headers()
         delete_response = requests.delete(delete_url, headers=headers)
         delete_response.raise_for_status()
@@ -70,6 +70,56 @@ def test_move_file(client):
     result = client.move_file(FOLDER, moved_file_name, FOLDER, file_name)
 
 
+def test_move_file_safe(client):
+    file_name = "test_csv.csv"
+    moved_file_name = "test_csv_moved_safe.csv"
+
+    # Clean up: delete the destination file if it already exists
+    source_files_og = client.list_items(FOLDER)
+    if moved_file_name in source_files_og:
+        moved_file_meta = client.get_document(FOLDER, moved_file_name)
+        moved_file_id = moved_file_meta["id"]
+        delete_url = client._items_prefix + moved_file_id
+        headers = token_manager.get_headers()
+        delete_response = requests.delete(delete_url, headers=headers)
+        delete_response.raise_for_status()
+
+    # Move the file via the copy-then-delete path
+    result = client.move_file(FOLDER, file_name, FOLDER, moved_file_name, safe=True)
+    assert result["name"] == moved_file_name
+
+    # Confirm the file is no longer in the source and landed at the dest
+    source_files = client.list_items(FOLDER)
+    assert file_name not in source_files
+    assert moved_file_name in source_files
+
+    # Move it back
+    client.move_file(FOLDER, moved_file_name, FOLDER, file_name, safe=True)
+
+
+def test_batch_get_documents_order(client):
+    pairs = [(FOLDER, "test_json.json"), (FOLDER, "test_csv.csv")]
+    docs = client.batch_get_documents(pairs)
+    assert [d["name"] for d in docs] == ["test_json.json", "test_csv.csv"]
+
+
+def test_batch_get(client):
+    paths = [f"{FOLDER}/{name}" for name in EXPECTED_TEST_FILES]
+    results = client.batch_get(paths)
+    assert set(results) == set(paths)
+    assert b"test_time" in results[f"{FOLDER}/test_json.json"]
+
+
+def test_list_items_bulk(client):
+    listed = client.list_items_bulk([FOLDER])
+    assert len(set(EXPECTED_TEST_FILES) - set(listed[FOLDER])) == 0
+
+
+def test_document_exists(client):
+    assert client.document_exists(FOLDER, "test_json.json")
+    assert not client.document_exists(FOLDER, "no_such_file.json")
+
+
 def test_list_files(client):
     listed_files = client.list_items(FOLDER)
     assert len(set(EXPECTED_TEST_FILES) - set(listed_files)) == 0
@@ -96,6 +146,27 @@ def test_upload_and_download_file(client, tmp_path):
     pd.testing.assert_frame_equal(downloaded_df, local_df)
 
 
+def test_upload_and_download_large_file(client, tmp_path):
+    file_name = "test_large.bin"
+    local_path = tmp_path / file_name
+    # ~5 MB: crosses the 4 MB simple-upload limit so this exercises the
+    # upload-session chunking path rather than the single-PUT fast path.
+    payload = os.urandom(5 * 1024 * 1024)
+    local_path.write_bytes(payload)
+
+    result = client.upload_file(str(local_path), FOLDER)
+    assert result["name"] == file_name
+    assert result["size"] == len(payload)
+
+    downloaded_path = tmp_path / "downloaded.bin"
+    client.download_file(
+        folder_path=FOLDER,
+        file_name=file_name,
+        output_path=str(downloaded_path),
+    )
+    assert downloaded_path.read_bytes() == payload
+
+
 def test_list(client):
     assert "General" in client.list_top_level_folders()
 
@@ -0,0 +1,210 @@
+import asyncio
+from urllib.parse import quote
+
+try:
+    import httpx
+except ImportError as err:
+    raise ImportError(
+        "AsyncSharePointClient requires httpx. "
+        "Install it with: pip install wnm-sharepoint-client[async]"
+    ) from err
+
+import orjson
+
+from .auth import token_manager
+from .client import _SITE_NAMES, _SITES
+from .logger import logger
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2]); fall back
+# to HTTP/1.1 keep-alive when it isn't installed.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+
+class AsyncSharePointClient:
+    """
+    Asynchronous counterpart to SharePointClient for latency-bound bulk work.
+
+    Requests multiplex over a shared httpx.AsyncClient (HTTP/2 when available),
+    so many small Graph calls — metadata fan-out, bulk JSON reads, parallel
+    downloads — overlap instead of serializing one roundtrip at a time. Use as
+    an async context manager:
+
+        async with AsyncSharePointClient("HORTA") as client:
+            docs = await client.get_documents([(folder, name), ...])
+    """
+
+    def __init__(self, site_name: str, max_connections: int = 20):
+        """
+        Initialize the async SharePoint client with site and drive identifiers.
+
+        :param site_name: The unique identifier for a SharePoint site. Should exist as a key in the 'sites' section of config.json file.
+        :param max_connections: Maximum concurrent connections in the pool.
+        """
+        if site_name not in _SITE_NAMES:
+            err_msg = f"Given site_name is not in known list of sites from config file:\n{sorted(_SITE_NAMES)}"
+            raise ValueError(err_msg)
+
+        site_config = _SITES[site_name]
+        self.site_id = site_config["SITE_ID"]
+        self.drive_id = site_config["DRIVE_ID"]
+
+        drive_url = f"https://graph.microsoft.com/v1.0/sites/{self.site_id}/drives/{self.drive_id}"
+        self._root_prefix = f"{drive_url}/root:/"
+
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def _build_url(self, path: str) -> str:
+        """
+        Build a SharePoint Graph API URL for a given path.
+
+        :param path: Path to the file or folder within the document library.
+        :return: Full API URL.
+        """
+        return self._root_prefix + quote(path, safe="/:")
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Issue an authenticated request, retrying once on 401.
+
+        Token refresh goes through the shared (synchronous) TokenManager; the
+        refresh itself is rare and short, so it is not worth an async port.
+
+        :param method: HTTP method (e.g., "GET", "PUT").
+        :param url: Full request URL.
+        :param kwargs: Extra arguments passed to httpx. Any `headers` given
+            here override the default auth headers.
+        :return: The httpx.Response (not raised for status).
+        """
+        headers = {**token_manager.get_headers(), **kwargs.pop("headers", {})}
+
+        # File-like bodies are consumed by the first attempt; remember where
+        # they started so a 401 retry can rewind instead of resending 0 bytes.
+        content = kwargs.get("content")
+        body_start = None
+        if content is not None and hasattr(content, "seek"):
+            try:
+                body_start = content.tell()
+            except (OSError, ValueError):
+                body_start = None
+
+        response = await self._client.request(method, url, headers=headers, **kwargs)
+        if response.status_code == 401:
+            if content is not None and hasattr(content, "read") and body_start is None:
+                # An unrewindable stream is already drained; retrying would
+                # silently truncate the body, so surface the 401 as-is.
+                return response
+            logger.info("Got 401, refreshing token and retrying once...")
+            token_manager.refresh_token()
+            headers["Authorization"] = f"Bearer {token_manager.get_token()}"
+            if body_start is not None:
+                content.seek(body_start)
+            response = await self._client.request(
+                method, url, headers=headers, **kwargs
+            )
+        return response
+
+    async def get_document(self, folder: str, file_name: str) -> dict:
+        """
+        Retrieve metadata for a document in a specified folder.
+
+        :param folder: Folder path relative to "General".
+        :param file_name: The name of the file.
+        :return: Metadata dictionary.
+        """
+        response = await self._request("GET", self._build_url(f"{folder}/{file_name}"))
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def list_items(self, folder_path: str, page_size: int = 999) -> list:
+        """
+        List file and folder names within a given folder, following pagination.
+
+        :param folder_path: Folder path relative to the drive root.
+        :param page_size: Items per page (Graph caps this at 999).
+        :return: List of item names.
+        """
+        url = (
+            self._build_url(f"{folder_path}:/children")
+            + f"?$top={page_size}&$select=name,id"
+        )
+        names = []
+        while url:
+            response = await self._request("GET", url)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            names.extend(d["name"] for d in data["value"])
+            url = data.get("@odata.nextLink")
+        return names
+
+    async def read_json(self, folder_path: str, file_name: str) -> dict:
+        """
+        Read and parse a JSON file from SharePoint.
+
+        :param folder_path: Folder path where the JSON file is located.
+        :param file_name: Name of the JSON file.
+        :return: Parsed JSON content as a dictionary.
+        """
+        url = self._build_url(f"{folder_path}/{file_name}:/content")
+        response = await self._request("GET", url)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def download_file(self, folder_path: str, file_name: str, output_path: str):
+        """
+        Download a file from SharePoint to a local path.
+
+        :param folder_path: Folder path.
+        :param file_name: File name to download.
+        :param output_path: Path to save the downloaded file locally.
+        """
+        url = self._build_url(f"{folder_path}/{file_name}:/content")
+        headers = dict(token_manager.get_headers())
+        async with self._client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            with open(output_path, "wb") as f:
+                async for chunk in response.aiter_bytes(1 << 20):
+                    f.write(chunk)
+
+    async def get_documents(self, pairs: list) -> list:
+        """
+        Retrieve metadata for many (folder, file_name) pairs concurrently.
+
+        :param pairs: (folder, file_name) tuples.
+        :return: Metadata dictionaries in the same order as `pairs`.
+        """
+        return await asyncio.gather(
+            *(self.get_document(folder, name) for folder, name in pairs)
+        )
+
+    async def read_jsons(self, pairs: list) -> list:
+        """
+        Read and parse many JSON files concurrently.
+
+        :param pairs: (folder_path, file_name) tuples.
+        :return: Parsed JSON contents in the same order as `pairs`.
+        """
+        return await asyncio.gather(
+            *(self.read_json(folder, name) for folder, name in pairs)
+        )
@@ -28,9 +28,19 @@ class TokenManager(metaclass=SingletonMeta):
     def __init__(self):
         self.token = None
         self.expiry = 0
+        self._cached_headers = None
         self._lock = threading.Lock()
 
+    def is_expiring(self, skew: int = 60) -> bool:
+        """Return True if the token is missing or within `skew` seconds of expiry."""
+        return not self.token or time.time() >= self.expiry - skew
+
     def get_token(self) -> str:
+        # Double-checked locking (as in SingletonMeta): skip the lock entirely
+        # while the token is valid so concurrent Graph calls don't serialize
+        # on the mutex, and re-check under the lock before refreshing.
+        if self.token and time.time() < self.expiry:
+            return self.token
         with self._lock:
             if not self.token or time.time() >= self.expiry:
                 self.refresh_token()
@@ -52,12 +62,18 @@ class TokenManager(metaclass=SingletonMeta):
         self.expiry = (
             time.time() + int(token_data.get("expires_in", 3600)) - 60
         )  # Refresh 1 min before expiry
-
-    def get_headers(self) -> dict:
-        return {
-            "Authorization": f"Bearer {self.get_token()}",
+        self._cached_headers = {
+            "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
         }
 
+    def get_headers(self) -> dict:
+        # Lock-free fast path: reuse the cached dict until the token nears
+        # expiry. Callers must not mutate the returned dict.
+        if self._cached_headers and time.time() < self.expiry - 60:
+            return self._cached_headers
+        self.get_token()
+        return self._cached_headers
+
 
 token_manager = TokenManager()
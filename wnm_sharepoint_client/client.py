@@ -1,406 +1,1061 @@
-import json
-from io import BytesIO, StringIO
-from pathlib import Path
-from typing import Optional
-
-import pandas as pd
-import psutil
-import requests
-
-from .auth import token_manager
-from .config import SITE_MANAGER
-from .logger import logger
-
-
-class SharePointClient:
-    def __init__(self, site_name: str):
-        """
-        Initialize the SharePoint client with site and drive identifiers.
-
-        :param site_name: The unique identifier for a SharePoint site. Should exist as a key in the 'sites' section of config.json file.
-        """
-        # verify the site name and then load the site_id and drive_id
-        if site_name not in SITE_MANAGER["sites"].keys():
-            err_msg = f"Given site_name is not in known list of sites from .env file:\n{list(SITE_MANAGER.keys())}"
-            raise ValueError(err_msg)
-        else:
-            site_id = SITE_MANAGER["sites"][site_name]["SITE_ID"]
-            drive_id = SITE_MANAGER["sites"][site_name]["DRIVE_ID"]
-
-        self.site_id = site_id
-        self.drive_id = drive_id
-
-    def _build_url(self, path: str) -> str:
-        """
-        Build a SharePoint Graph API URL for a given path.
-
-        :param path: Path to the file or folder within the document library.
-        :return: Full API URL.
-        """
-        return f"https://graph.microsoft.com/v1.0/sites/{self.site_id}/drives/{self.drive_id}/root:/{path}"
-
-    def list_items(self, folder_path: str):
-        """
-        List file and folder names within a given folder.
-
-        :param folder_path: Folder path relative to the drive root (e.g., "Documents/Reports").
-        :return: List of item names.
-        """
-        url = self._build_url(f"{folder_path}:/children")
-        response = requests.get(url, headers=token_manager.get_headers())
-        response.raise_for_status()
-        return [d["name"] for d in response.json()["value"]]
-
-    def get_document(self, folder: str, file_name: str) -> dict:
-        """
-        Retrieve metadata for a document in a specified folder.
-
-        :param folder: Folder path relative to "General".
-        :param file_name: The name of the file.
-        :return: Metadata dictionary.
-        """
-        url = self._build_url(f"{folder}/{file_name}")
-        response = requests.get(url, headers=token_manager.get_headers())
-        response.raise_for_status()
-        return response.json()
-
-    def read_spreadsheet(self, folder_path: str, file_name: str) -> pd.DataFrame:
-        """
-        Download and read an Excel or CSV file into a pandas DataFrame.
-
-        :param folder_path: Folder where the spreadsheet is stored.
-        :param file_name: Name of the file (should end in .xlsx or .csv).
-        :return: DataFrame with file contents.
-        """
-        meta = self.get_document(folder_path, file_name)
-        url = meta["@microsoft.graph.downloadUrl"]
-        r = requests.get(url)
-        r.raise_for_status()
-
-        if file_name.endswith(".xlsx"):
-            return pd.read_excel(BytesIO(r.content))
-        if file_name.endswith(".csv"):
-            return pd.read_csv(BytesIO(r.content))
-        raise ValueError(f"Unsupported file type for spreadsheet: {file_name}")
-
-    def read_json(self, folder_path: str, file_name: str) -> dict:
-        """
-        Read and parse a JSON file from SharePoint.
-
-        :param folder_path: Folder path where the JSON file is located.
-        :param file_name: Name of the JSON file.
-        :return: Parsed JSON content as a dictionary.
-        """
-        meta = self.get_document(folder_path, file_name)
-        url = meta["@microsoft.graph.downloadUrl"]
-        r = requests.get(url)
-        r.raise_for_status()
-        return json.loads(r.content)
-
-    def read_swc(self, folder_path: str, file_name: str) -> pd.DataFrame:
-        """
-        Read an SWC neuron morphology file into a pandas DataFrame.
-
-        :param folder_path: Folder path to the SWC file.
-        :param file_name: Name of the SWC file.
-        :return: DataFrame with SWC structure.
-        """
-        meta = self.get_document(folder_path, file_name)
-        url = meta["@microsoft.graph.downloadUrl"]
-        r = requests.get(url)
-        lines = [line for line in StringIO(r.text) if not line.startswith("#")]
-        parsed = [line.strip().split() for line in lines]
-        columns = ["n", "type", "x", "y", "z", "radius", "parent"]
-        return pd.DataFrame(parsed, columns=columns)
-
-    def upload_json(self, data: dict, folder: str, file_name: str) -> dict:
-        """
-        Upload a JSON dictionary as a file to SharePoint.
-
-        :param data: Dictionary to upload.
-        :param folder: Target folder on SharePoint.
-        :param file_name: Name of the file to create (must end in .json).
-        :return: Upload response metadata.
-        """
-        url = self._build_url(f"{folder}/{file_name}:/content")
-        buffer = BytesIO(json.dumps(data, indent=4).encode("utf-8"))
-        buffer.seek(0)
-        headers = token_manager.get_headers()
-        headers["Content-Type"] = "application/json"
-        response = requests.put(url, headers=headers, data=buffer)
-        response.raise_for_status()
-        return response.json()
-
-    def upload_csv(self, df: pd.DataFrame, folder: str, file_name: str) -> dict:
-        """
-        Upload a pandas DataFrame as a CSV to SharePoint.
-
-        :param df: DataFrame to upload.
-        :param folder: Target folder.
-        :param file_name: File name (must end in .csv).
-        :return: Upload response metadata.
-        """
-        url = self._build_url(f"{folder}/{file_name}:/content")
-        buffer = StringIO()
-        df.to_csv(buffer, index=False)
-        buffer.seek(0)
-        headers = token_manager.get_headers()
-        headers["Content-Type"] = "text/csv"
-        response = requests.put(url, headers=headers, data=buffer)
-        response.raise_for_status()
-        return response.json()
-
-    def upload_swc(self, df: pd.DataFrame, folder: str, file_name: str) -> dict:
-        """
-        Upload a neuron morphology DataFrame as an SWC file.
-
-        :param df: DataFrame in SWC format.
-        :param folder: SharePoint folder path.
-        :param file_name: File name (must end in .swc).
-        :return: Upload response metadata.
-        """
-        url = self._build_url(f"{folder}/{file_name}:/content")
-        buffer = StringIO()
-        buffer.write("# " + " ".join(df.columns) + "\n")
-        df.to_csv(buffer, sep=" ", header=False, index=False)
-        buffer.seek(0)
-        headers = token_manager.get_headers()
-        headers["Content-Type"] = "text/plain"
-        response = requests.put(url, headers=headers, data=buffer)
-        response.raise_for_status()
-        return response.json()
-
-    def upload_file(self, local_path: str, folder: str) -> dict:
-        """
-        Upload a local file to SharePoint.
-
-        :param local_path: Path to the local file.
-        :param folder: Folder path on SharePoint to upload into.
-        :return: Upload response metadata.
-        """
-        local_path = Path(local_path)
-        url = self._build_url(f"{folder}/{local_path.name}:/content")
-        headers = token_manager.get_headers()
-        headers["Content-Type"] = "application/octet-stream"
-        with open(local_path, "rb") as f:
-            response = requests.put(url, headers=headers, data=f)
-        response.raise_for_status()
-        return response.json()
-
-    def download_file(self, folder_path: str, file_name: str, output_path: str):
-        """
-        Download a file from SharePoint to a local path using its folder and file name.
-
-        :param folder_path: Folder path.
-        :param file_name: File name to download.
-        :param output_path: Path to save the downloaded file locally.
-        """
-        meta = self.get_document(folder_path, file_name)
-        url = meta["@microsoft.graph.downloadUrl"]
-
-        response = requests.get(url)
-        response.raise_for_status()
-
-        with open(output_path, "wb") as f:
-            f.write(response.content)
-
-    def create_folder(self, parent_path: str, new_folder_name: str) -> dict:
-        """
-        Create a new folder in SharePoint.
-
-        :param parent_path: Path to the parent folder (relative to the 'General' folder).
-        :param new_folder_name: Name of the folder to create.
-        :return: Response metadata from SharePoint.
-        """
-        url = self._build_url(f"{parent_path}:/children")
-        headers = token_manager.get_headers()
-        headers["Content-Type"] = "application/json"
-
-        payload = {
-            "name": new_folder_name,
-            "folder": {},
-            "@microsoft.graph.conflictBehavior": "fail",
-        }
-
-        response = requests.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        return response.json()
-
-    def move_file(
-        self,
-        source_folder: str,
-        file_name: str,
-        dest_folder: str,
-        new_file_name: Optional[str] = None,
-    ) -> dict:
-        """
-        Safely move a file from one folder to another, optionally renaming it:
-        - Downloads file content into memory first.
-        - Moves the file via Graph API.
-        - If move fails, restores original file from memory.
-
-        :param source_folder: Current folder path .
-        :param file_name: Name of the file to move.
-        :param dest_folder: Destination folder path .
-        :param new_file_name: Optional new name for the file at the destination.
-        :return: Metadata of the moved file.
-        """
-        headers = token_manager.get_headers()
-        headers["Content-Type"] = "application/json"
-
-        dest_file_name = new_file_name or file_name
-
-        # Build paths
-        src_path = f"{source_folder}/{file_name}"
-        dest_path = f"{dest_folder}/{dest_file_name}"
-
-        file_bytes = None  # safeguard in case download fails
-
-        try:
-            # Step 1: Get file metadata
-            meta = self.get_document(source_folder, file_name)
-            item_id = meta["id"]
-            download_url = meta["@microsoft.graph.downloadUrl"]
-
-            logger.info(
-                f"[SAFE_MOVE_FILE] Preparing to move file '{file_name}' from '{source_folder}' to '{dest_folder}' as '{dest_file_name}'",
-            )
-
-            # Step 2: Download content into memory and check size
-            file_response = requests.get(download_url)
-            file_response.raise_for_status()
-            file_bytes = file_response.content
-
-            max_safe_size = get_dynamic_max_safe_size()
-            if len(file_bytes) > max_safe_size:
-                raise MemoryError(
-                    f"[SAFE_MOVE_FILE] File too large to safely move in memory "
-                    f"({len(file_bytes)} bytes > {max_safe_size} bytes)",
-                )
-
-            # Step 3: Check for conflict at destination
-            dest_check = requests.get(self._build_url(dest_path), headers=headers)
-            if dest_check.status_code == 200:
-                raise Exception(
-                    f"[SAFE_MOVE_FILE] Conflict: '{dest_file_name}' already exists at destination '{dest_folder}'.",
-                )
-
-            # Step 4: Get destination folder's item ID
-            dest_folder_meta = requests.get(
-                self._build_url(f"{dest_folder}"), headers=headers
-            )
-            dest_folder_meta.raise_for_status()
-            parent_id = dest_folder_meta.json()["id"]
-
-            # Step 5: Try to move and rename the file via PATCH
-            patch_url = f"https://graph.microsoft.com/v1.0/sites/{self.site_id}/drives/{self.drive_id}/items/{item_id}"
-            payload = {
-                "parentReference": {"id": parent_id},
-                "name": dest_file_name,
-            }
-
-            move_response = requests.patch(patch_url, headers=headers, json=payload)
-            move_response.raise_for_status()
-
-            logger.info(
-                f"[SAFE_MOVE_FILE] Successfully moved '{file_name}' to '{dest_folder}/{dest_file_name}'",
-            )
-            return move_response.json()
-
-        except Exception as e:
-            logger.error(f"[SAFE_MOVE_FILE] Move failed for '{file_name}': {e}")
-
-            # Step 6: Attempt recovery only if file was downloaded
-            if file_bytes:
-                try:
-                    recovery_url = self._build_url(src_path + ":/content")
-                    recovery_headers = token_manager.get_headers()
-                    recovery_headers["Content-Type"] = "application/octet-stream"
-                    recovery_response = requests.put(
-                        recovery_url, headers=recovery_headers, data=file_bytes
-                    )
-                    recovery_response.raise_for_status()
-
-                    logger.warning(
-                        f"[SAFE_MOVE_FILE] Recovered original file '{file_name}' to '{source_folder}'",
-                    )
-                except Exception as recover_err:
-                    logger.critical(
-                        f"[SAFE_MOVE_FILE] Failed to recover original file '{file_name}': {recover_err}",
-                    )
-                    raise
-            else:
-                logger.warning(
-                    "[SAFE_MOVE_FILE] Skipped recovery: No file_bytes to restore."
-                )
-
-            raise
-
-    def list_drives(self) -> list:
-        """
-        List all drives (document libraries) available under the site.
-
-        :return: List of drives with metadata (id, name, etc.).
-        """
-        url = f"https://graph.microsoft.com/v1.0/sites/{self.site_id}/drives"
-        response = requests.get(url, headers=token_manager.get_headers())
-        response.raise_for_status()
-        drives = response.json()["value"]
-        logger.info(f"[DISCOVERY] Found {len(drives)} drives.")
-        return drives
-
-    def list_top_level_folders(self):
-        """
-        List top-level folders in the SharePoint site's document library.
-
-        :return: List of top-level folder names.
-        """
-        url = f"https://graph.microsoft.com/v1.0/sites/{self.site_id}/drives/{self.drive_id}/root/children"
-        response = requests.get(url, headers=token_manager.get_headers())
-        response.raise_for_status()
-        return [item["name"] for item in response.json()["value"] if "folder" in item]
-
-    def print_directory(
-        self, folder_path: str, indent: int = 0, show_files: bool = False
-    ):
-        """
-        Recursively prints the folder (and optionally file) structure of a SharePoint directory.
-
-        :param folder_path: The relative path from the drive root
-        :param indent: Current indentation level (used in recursion)
-        :param show_files: Whether to include files in the output
-        """
-        try:
-            url = self._build_url(
-                "root"
-                if folder_path.strip() in ("", "/")
-                else f"{folder_path}:/children"
-            )
-            response = requests.get(url, headers=token_manager.get_headers())
-            response.raise_for_status()
-            items = response.json().get("value", [])
-        except Exception as e:
-            print(" " * indent + f"[ERROR] {folder_path} - {e}")
-            return
-
-        for item in items:
-            is_folder = item.get("folder")
-            if is_folder:
-                print(" " * indent + item["name"])
-                new_path = (
-                    f"{folder_path}/{item['name']}" if folder_path else item["name"]
-                )
-                self.print_directory(new_path, indent + 4, show_files)
-            elif show_files:
-                print(" " * indent + item["name"])
-
-
-def get_dynamic_max_safe_size(fraction: float = 0.2) -> int:
-    """
-    Returns a dynamic max safe size in bytes, based on a fraction of available memory.
-    """
-    available_bytes = psutil.virtual_memory().available
-    return int(available_bytes * fraction)
-
-def list_available_sites():
-    return list(SITE_MANAGER["sites"].keys())
+import functools
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+import orjson
+import pandas as pd
+import psutil
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .auth import token_manager
+from .config import SITE_MANAGER
+from .logger import logger
+
+# Hoisted once at import: site lookups don't change after config load.
+_SITES: dict = SITE_MANAGER["sites"]
+_SITE_NAMES = frozenset(_SITES)
+
+# Prefer the Rust-backed calamine engine for xlsx when installed; it is
+# several times faster and lighter than pure-Python openpyxl.
+try:
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = "openpyxl"
+
+# Graph's simple (single PUT) upload is capped at 4 MB; larger files must go
+# through an upload session, sent in chunks that are a multiple of 320 KiB.
+_SIMPLE_UPLOAD_LIMIT = 4 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+
+# How long document metadata (including downloadUrl, valid ~1h) may be served
+# from cache without any network roundtrip.
+_DOC_CACHE_TTL = 300
+
+# Upper bound on waiting for an async server-side copy to settle before
+# giving up on the move; polls run every 0.5 s.
+_COPY_MONITOR_TIMEOUT = 120
+
+
+def _graph_json(response: requests.Response):
+    """Parse a Graph response body with orjson (faster than stdlib-backed .json())."""
+    return orjson.loads(response.content)
+
+
+class SharePointClient:
+    def __init__(self, site_name: str, max_retries: int = 5, pool_maxsize: int = 32):
+        """
+        Initialize the SharePoint client with site and drive identifiers.
+
+        :param site_name: The unique identifier for a SharePoint site. Should exist as a key in the 'sites' section of config.json file.
+        :param max_retries: How many times throttled/failed requests (429/5xx) are retried with backoff.
+        :param pool_maxsize: Maximum keep-alive connections in the HTTP pool.
+        """
+        # verify the site name and then load the site_id and drive_id
+        if site_name not in _SITE_NAMES:
+            err_msg = f"Given site_name is not in known list of sites from config file:\n{sorted(_SITE_NAMES)}"
+            raise ValueError(err_msg)
+
+        site_config = _SITES[site_name]
+        site_id = site_config["SITE_ID"]
+        drive_id = site_config["DRIVE_ID"]
+
+        self.site_id = site_id
+        self.drive_id = drive_id
+
+        # URL prefixes are fixed per client; precompute them once instead of
+        # reformatting the constant parts on every call.
+        drive_url = (
+            f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}"
+        )
+        self._root_prefix = f"{drive_url}/root:/"
+        self._items_prefix = f"{drive_url}/items/"
+
+        # One pooled session per client: TLS/TCP setup is paid once per host
+        # and connections are kept alive across Graph calls. Graph throttles
+        # aggressively with 429 + Retry-After, so the adapter retries those
+        # (and transient 5xx) with exponential backoff instead of aborting.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=1.0,
+            respect_retry_after_header=True,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "PUT", "POST", "PATCH", "DELETE"]),
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry
+            ),
+        )
+
+        # url -> (etag, parsed body) for conditional metadata GETs
+        self._etag_cache = {}
+        # (folder, file_name) -> (expires_at, metadata) for get_document
+        self._doc_cache = {}
+
+    def close(self):
+        """Close the pooled HTTP session and its keep-alive connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _build_url(self, path: str) -> str:
+        """
+        Build a SharePoint Graph API URL for a given path.
+
+        :param path: Path to the file or folder within the document library.
+        :return: Full API URL.
+        """
+        # safe="/:" keeps path separators and the ":/children"-style suffixes
+        # intact while encoding spaces and other special characters.
+        return self._root_prefix + quote(path, safe="/:")
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Issue an authenticated request, refreshing the token proactively and
+        retrying once on 401.
+
+        Refreshing before a call (rather than letting it fail mid-burst) saves
+        a full wasted roundtrip per token rollover.
+
+        :param method: HTTP method (e.g., "GET", "PUT").
+        :param url: Full request URL.
+        :param kwargs: Extra arguments passed to `requests.request`. Any
+            `headers` given here override the default auth headers.
+        :return: The `requests.Response` (not raised for status).
+        """
+        if token_manager.is_expiring():
+            token_manager.get_token()
+        # Copy before merging overrides: get_headers() returns a shared dict.
+        headers = {**token_manager.get_headers(), **kwargs.pop("headers", {})}
+
+        # File-like bodies are consumed by the first attempt; remember where
+        # they started so a 401 retry can rewind instead of resending 0 bytes.
+        data = kwargs.get("data")
+        body_start = None
+        if data is not None and hasattr(data, "seek"):
+            try:
+                body_start = data.tell()
+            except (OSError, ValueError):
+                body_start = None
+
+        response = self._session.request(method, url, headers=headers, **kwargs)
+        if response.status_code == 401:
+            if data is not None and hasattr(data, "read") and body_start is None:
+                # An unrewindable stream is already drained; retrying would
+                # silently truncate the body, so surface the 401 as-is.
+                return response
+            logger.info("Got 401, refreshing token and retrying once...")
+            token_manager.refresh_token()
+            headers["Authorization"] = f"Bearer {token_manager.get_token()}"
+            if body_start is not None:
+                data.seek(body_start)
+            response = self._session.request(method, url, headers=headers, **kwargs)
+        return response
+
+    def _get_json_cached(self, url: str) -> dict:
+        """
+        GET a Graph URL with ETag revalidation.
+
+        When the URL was fetched before, the cached ETag is sent as
+        If-None-Match; a 304 reply carries no body and the cached JSON is
+        returned, which keeps repeated metadata lookups (e.g. the
+        back-to-back calls in `move_file`) cheap.
+
+        :param url: Full API URL.
+        :return: Parsed JSON body.
+        """
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self._request("GET", url, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        data = _graph_json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            if len(self._etag_cache) >= 128:
+                # Drop the oldest entry (dicts preserve insertion order).
+                self._etag_cache.pop(next(iter(self._etag_cache)))
+            self._etag_cache[url] = (etag, data)
+        return data
+
+    def _content_url(self, path: str) -> str:
+        """
+        Build the Graph content endpoint URL for a file path.
+
+        The content endpoint redirects straight to the download URL, so callers
+        can fetch file bytes in a single request without a prior metadata GET.
+
+        :param path: Path to the file within the document library.
+        :return: Full API URL for the file's content.
+        """
+        return self._build_url(f"{path}:/content")
+
+    def _fetch_content(
+        self,
+        folder_path: str,
+        file_name: str,
+        meta: Optional[dict] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        GET a file's content, preferring caller-supplied metadata.
+
+        When `meta` (as returned by get_document/batch_get_documents) carries
+        a downloadUrl, the pre-authenticated CDN URL is hit directly and the
+        Graph hop is skipped entirely.
+
+        :param folder_path: Folder path to the file.
+        :param file_name: Name of the file.
+        :param meta: Optional item metadata containing a downloadUrl.
+        :param stream: Whether to stream the response body.
+        :return: The content response (not raised for status).
+        """
+        if meta is not None and "@microsoft.graph.downloadUrl" in meta:
+            return self._session.get(
+                meta["@microsoft.graph.downloadUrl"], stream=stream
+            )
+        url = self._content_url(f"{folder_path}/{file_name}")
+        return self._request("GET", url, allow_redirects=True, stream=stream)
+
+    def iter_items(self, folder_path: str, page_size: int = 999):
+        """
+        Lazily iterate item names within a folder, following Graph pagination.
+
+        Graph pages children at 200 by default, so folders with more items
+        than one page would otherwise be silently truncated. $select trims
+        each response to the fields needed, and pages are fetched on demand
+        so arbitrarily large folders stay memory-bounded.
+
+        :param folder_path: Folder path relative to the drive root (e.g., "Documents/Reports").
+        :param page_size: Items per page (Graph caps this at 999).
+        :return: Generator of item names.
+        """
+        url = (
+            self._build_url(f"{folder_path}:/children")
+            + f"?$top={page_size}&$select=name,id"
+        )
+        while url:
+            data = self._get_json_cached(url)
+            for d in data["value"]:
+                yield d["name"]
+            url = data.get("@odata.nextLink")
+
+    def list_items(self, folder_path: str):
+        """
+        List file and folder names within a given folder.
+
+        :param folder_path: Folder path relative to the drive root (e.g., "Documents/Reports").
+        :return: List of item names.
+        """
+        return list(self.iter_items(folder_path))
+
+    def list_items_bulk(self, folder_paths: list) -> dict:
+        """
+        List file and folder names for many folders concurrently.
+
+        Listings are fetched with a bounded thread pool over the shared
+        keep-alive session, so N folders cost roughly N/16 serialized
+        roundtrips instead of N.
+
+        :param folder_paths: Folder paths relative to the drive root.
+        :return: Dict mapping each folder path to its list of item names.
+        """
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            names = pool.map(self.list_items, folder_paths)
+        return dict(zip(folder_paths, names))
+
+    def get_document(self, folder: str, file_name: str, use_cache: bool = True) -> dict:
+        """
+        Retrieve metadata for a document in a specified folder.
+
+        Results are cached for a short TTL so repeat lookups of the same file
+        skip the network entirely; pass `use_cache=False` to force a fresh
+        fetch.
+
+        :param folder: Folder path relative to "General".
+        :param file_name: The name of the file.
+        :param use_cache: Whether recently fetched metadata may be reused.
+        :return: Metadata dictionary.
+        """
+        key = (folder, file_name)
+        if use_cache:
+            hit = self._doc_cache.get(key)
+            if hit and time.time() < hit[0]:
+                return hit[1]
+
+        url = self._build_url(f"{folder}/{file_name}")
+        data = self._get_json_cached(url)
+        if len(self._doc_cache) >= 128:
+            self._doc_cache.pop(next(iter(self._doc_cache)))
+        self._doc_cache[key] = (time.time() + _DOC_CACHE_TTL, data)
+        return data
+
+    def document_exists(self, folder: str, file_name: str) -> bool:
+        """
+        Cheaply check whether a document exists.
+
+        Requests only the item's id ($select) so the server skips serializing
+        the full metadata body. Graph rejects HEAD on driveItems, so a
+        minimal GET is the lightest probe available.
+
+        :param folder: Folder path relative to "General".
+        :param file_name: The name of the file.
+        :return: True if the document exists, False on 404.
+        """
+        url = self._build_url(f"{folder}/{file_name}") + "?$select=id"
+        response = self._request("GET", url)
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+
+    def read_spreadsheet(
+        self,
+        folder_path: str,
+        file_name: str,
+        meta: Optional[dict] = None,
+        **read_kwargs,
+    ) -> pd.DataFrame:
+        """
+        Download and read an Excel or CSV file into a pandas DataFrame.
+
+        :param folder_path: Folder where the spreadsheet is stored.
+        :param file_name: Name of the file (should end in .xlsx or .csv).
+        :param meta: Optional item metadata (from get_document /
+            batch_get_documents); its downloadUrl skips the Graph hop.
+        :param read_kwargs: Extra arguments forwarded to pd.read_excel /
+            pd.read_csv (e.g., sheet_name, usecols, dtype) so callers can
+            materialize only the columns they need.
+        :return: DataFrame with file contents.
+        """
+        with self._fetch_content(folder_path, file_name, meta, stream=True) as r:
+            r.raise_for_status()
+
+            if file_name.endswith(".xlsx"):
+                # The xlsx reader needs a seekable file; spool to a temp file
+                # (memory up to 16 MB, disk beyond) instead of holding the
+                # whole download in RAM.
+                r.raw.decode_content = True
+                spool = tempfile.SpooledTemporaryFile(max_size=16 << 20)
+                shutil.copyfileobj(r.raw, spool, length=1 << 20)
+                spool.seek(0)
+                return pd.read_excel(spool, engine=_EXCEL_ENGINE, **read_kwargs)
+            if file_name.endswith(".csv"):
+                # Feed the raw stream straight to the parser instead of
+                # buffering the whole file in memory first.
+                r.raw.decode_content = True
+                return pd.read_csv(r.raw, **read_kwargs)
+        raise ValueError(f"Unsupported file type for spreadsheet: {file_name}")
+
+    def read_json(
+        self, folder_path: str, file_name: str, meta: Optional[dict] = None
+    ) -> dict:
+        """
+        Read and parse a JSON file from SharePoint.
+
+        :param folder_path: Folder path where the JSON file is located.
+        :param file_name: Name of the JSON file.
+        :param meta: Optional item metadata (from get_document /
+            batch_get_documents); its downloadUrl skips the Graph hop.
+        :return: Parsed JSON content as a dictionary.
+        """
+        r = self._fetch_content(folder_path, file_name, meta)
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+    def read_swc(
+        self, folder_path: str, file_name: str, meta: Optional[dict] = None
+    ) -> pd.DataFrame:
+        """
+        Read an SWC neuron morphology file into a pandas DataFrame.
+
+        :param folder_path: Folder path to the SWC file.
+        :param file_name: Name of the SWC file.
+        :param meta: Optional item metadata (from get_document /
+            batch_get_documents); its downloadUrl skips the Graph hop.
+        :return: DataFrame with SWC structure.
+        """
+        with self._fetch_content(folder_path, file_name, meta, stream=True) as r:
+            r.raise_for_status()
+            # Let pandas' C parser handle comment filtering, whitespace
+            # splitting, and numeric conversion instead of a Python loop.
+            r.raw.decode_content = True
+            return pd.read_csv(
+                r.raw,
+                sep=r"\s+",
+                comment="#",
+                header=None,
+                names=["n", "type", "x", "y", "z", "radius", "parent"],
+                dtype={
+                    "n": "int32",
+                    "type": "int8",
+                    "x": "float32",
+                    "y": "float32",
+                    "z": "float32",
+                    "radius": "float32",
+                    "parent": "int32",
+                },
+            )
+
+    def batch_get_documents(self, pairs: list) -> list:
+        """
+        Retrieve metadata for many (folder, file_name) pairs in batched requests.
+
+        Groups lookups into $batch POSTs of up to 20 subrequests each, so
+        metadata fan-out over a folder's files costs ceil(N / 20) roundtrips
+        instead of N individual get_document calls.
+
+        :param pairs: (folder, file_name) tuples, as passed to get_document.
+        :return: Metadata dictionaries in the same order as `pairs`.
+        """
+        results = []
+        for start in range(0, len(pairs), 20):
+            chunk = pairs[start : start + 20]
+            batch_payload = {
+                "requests": [
+                    {
+                        "id": str(i),
+                        "method": "GET",
+                        "url": f"/sites/{self.site_id}/drives/{self.drive_id}/root:/{folder}/{file_name}",
+                    }
+                    for i, (folder, file_name) in enumerate(chunk)
+                ],
+            }
+            response = self._request(
+                "POST",
+                "https://graph.microsoft.com/v1.0/$batch",
+                json=batch_payload,
+            )
+            response.raise_for_status()
+            by_id = {item["id"]: item for item in _graph_json(response)["responses"]}
+            results.extend(by_id[str(i)].get("body") for i in range(len(chunk)))
+        return results
+
+    def batch_get(self, paths: list) -> dict:
+        """
+        Fetch the content of many file paths in batched requests.
+
+        Packs up to 20 content GETs per POST to the Graph $batch endpoint.
+        Graph answers each :/content subrequest with a 302 whose Location is
+        a pre-authenticated download URL; those redirects are followed here,
+        so the per-item Graph roundtrips collapse to ceil(N / 20) and the
+        remaining GETs go straight to the download host.
+
+        :param paths: File paths relative to the drive root.
+        :return: Dict mapping each path to its file content as bytes.
+            Non-redirect subresponses (e.g. a 404 for a missing path) keep
+            their raw $batch body instead.
+        """
+        results = {}
+        for start in range(0, len(paths), 20):
+            chunk = paths[start : start + 20]
+            batch_payload = {
+                "requests": [
+                    {
+                        "id": str(i),
+                        "method": "GET",
+                        "url": f"/sites/{self.site_id}/drives/{self.drive_id}/root:/{path}:/content",
+                    }
+                    for i, path in enumerate(chunk)
+                ],
+            }
+            response = self._request(
+                "POST",
+                "https://graph.microsoft.com/v1.0/$batch",
+                json=batch_payload,
+            )
+            response.raise_for_status()
+            for item in _graph_json(response)["responses"]:
+                path = chunk[int(item["id"])]
+                if item["status"] == 302:
+                    # The download URL is pre-authenticated; no bearer header.
+                    content_response = self._session.get(item["headers"]["Location"])
+                    content_response.raise_for_status()
+                    results[path] = content_response.content
+                else:
+                    results[path] = item.get("body")
+        return results
+
+    def upload_json(
+        self, data: dict, folder: str, file_name: str, pretty: bool = False
+    ) -> dict:
+        """
+        Upload a JSON dictionary as a file to SharePoint.
+
+        :param data: Dictionary to upload.
+        :param folder: Target folder on SharePoint.
+        :param file_name: Name of the file to create (must end in .json).
+        :param pretty: If True, indent the output for human readers;
+            indentation roughly doubles the bytes on the wire, so the
+            default is compact.
+        :return: Upload response metadata.
+        """
+        url = self._build_url(f"{folder}/{file_name}:/content")
+        body = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        if len(body) > _SIMPLE_UPLOAD_LIMIT:
+            return self._upload_via_session(
+                f"{folder}/{file_name}", BytesIO(body), len(body)
+            )
+        response = self._request(
+            "PUT",
+            url,
+            headers={
+                "Content-Type": "application/json",
+                "Content-Length": str(len(body)),
+            },
+            data=body,
+        )
+        response.raise_for_status()
+        # The write supersedes any cached metadata for this path.
+        self._doc_cache.pop((folder, file_name), None)
+        return _graph_json(response)
+
+    def upload_csv(self, df: pd.DataFrame, folder: str, file_name: str) -> dict:
+        """
+        Upload a pandas DataFrame as a CSV to SharePoint.
+
+        :param df: DataFrame to upload.
+        :param folder: Target folder.
+        :param file_name: File name (must end in .csv).
+        :return: Upload response metadata.
+        """
+        url = self._build_url(f"{folder}/{file_name}:/content")
+        body = df.to_csv(index=False).encode("utf-8")
+        if len(body) > _SIMPLE_UPLOAD_LIMIT:
+            return self._upload_via_session(
+                f"{folder}/{file_name}", BytesIO(body), len(body)
+            )
+        response = self._request(
+            "PUT",
+            url,
+            headers={"Content-Type": "text/csv", "Content-Length": str(len(body))},
+            data=body,
+        )
+        response.raise_for_status()
+        self._doc_cache.pop((folder, file_name), None)
+        return _graph_json(response)
+
+    def upload_swc(self, df: pd.DataFrame, folder: str, file_name: str) -> dict:
+        """
+        Upload a neuron morphology DataFrame as an SWC file.
+
+        :param df: DataFrame in SWC format.
+        :param folder: SharePoint folder path.
+        :param file_name: File name (must end in .swc).
+        :return: Upload response metadata.
+        """
+        url = self._build_url(f"{folder}/{file_name}:/content")
+        header_line = "# " + " ".join(df.columns) + "\n"
+        body = (header_line + df.to_csv(sep=" ", header=False, index=False)).encode(
+            "utf-8"
+        )
+        if len(body) > _SIMPLE_UPLOAD_LIMIT:
+            return self._upload_via_session(
+                f"{folder}/{file_name}", BytesIO(body), len(body)
+            )
+        response = self._request(
+            "PUT",
+            url,
+            headers={"Content-Type": "text/plain", "Content-Length": str(len(body))},
+            data=body,
+        )
+        response.raise_for_status()
+        self._doc_cache.pop((folder, file_name), None)
+        return _graph_json(response)
+
+    def upload_file(self, local_path: str, folder: str) -> dict:
+        """
+        Upload a local file to SharePoint.
+
+        Files over Graph's 4 MB simple-upload limit are sent through a
+        resumable upload session in 10 MiB chunks; smaller files keep the
+        single-PUT fast path.
+
+        :param local_path: Path to the local file.
+        :param folder: Folder path on SharePoint to upload into.
+        :return: Upload response metadata.
+        """
+        local_path = Path(local_path)
+        file_size = local_path.stat().st_size
+        if file_size > _SIMPLE_UPLOAD_LIMIT:
+            with open(local_path, "rb") as f:
+                return self._upload_via_session(
+                    f"{folder}/{local_path.name}", f, file_size
+                )
+
+        url = self._build_url(f"{folder}/{local_path.name}:/content")
+        with open(local_path, "rb") as f:
+            response = self._request(
+                "PUT",
+                url,
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    # Known up front from stat: lets the PUT go out in a single
+                    # shot instead of chunked transfer encoding.
+                    "Content-Length": str(file_size),
+                },
+                data=f,
+            )
+        response.raise_for_status()
+        self._doc_cache.pop((folder, local_path.name), None)
+        return _graph_json(response)
+
+    def _upload_via_session(self, sharepoint_path: str, source, size: int) -> dict:
+        """
+        Upload a large body through a Graph upload session.
+
+        Chunks are read from `source` and go out sequentially (Graph requires
+        contiguous ranges) with Content-Range headers over the pooled
+        keep-alive session; 429/5xx replies retry just the failed chunk via
+        the adapter's backoff policy instead of restarting the whole upload.
+
+        :param sharepoint_path: Destination file path relative to the drive root.
+        :param source: File-like object to read the body from.
+        :param size: Total body size in bytes.
+        :return: Upload response metadata for the completed item.
+        """
+        session_url = self._build_url(f"{sharepoint_path}:/createUploadSession")
+        session_response = self._request(
+            "POST",
+            session_url,
+            json={"item": {"@microsoft.graph.conflictBehavior": "replace"}},
+        )
+        session_response.raise_for_status()
+        upload_url = _graph_json(session_response)["uploadUrl"]
+
+        logger.info(
+            f"[UPLOAD_SESSION] Uploading '{sharepoint_path}' ({size} bytes) in "
+            f"{_UPLOAD_CHUNK_SIZE} byte chunks"
+        )
+
+        start = 0
+        while start < size:
+            chunk = source.read(_UPLOAD_CHUNK_SIZE)
+            end = start + len(chunk) - 1
+            headers = {
+                "Content-Length": str(len(chunk)),
+                "Content-Range": f"bytes {start}-{end}/{size}",
+            }
+            # The uploadUrl is pre-authenticated; no bearer header.
+            response = self._session.put(upload_url, headers=headers, data=chunk)
+            response.raise_for_status()
+            start = end + 1
+
+        # The completed upload supersedes any cached metadata for this path.
+        folder, _, file_name = sharepoint_path.rpartition("/")
+        self._doc_cache.pop((folder, file_name), None)
+        return _graph_json(response)
+
+    def download_file(
+        self,
+        folder_path: str,
+        file_name: str,
+        output_path: str,
+        meta: Optional[dict] = None,
+    ):
+        """
+        Download a file from SharePoint to a local path using its folder and file name.
+
+        :param folder_path: Folder path.
+        :param file_name: File name to download.
+        :param output_path: Path to save the downloaded file locally.
+        :param meta: Optional item metadata (from get_document /
+            batch_get_documents); its downloadUrl skips the Graph hop.
+        """
+        with self._fetch_content(folder_path, file_name, meta, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(output_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
+
+    def create_folder(self, parent_path: str, new_folder_name: str) -> dict:
+        """
+        Create a new folder in SharePoint.
+
+        :param parent_path: Path to the parent folder (relative to the 'General' folder).
+        :param new_folder_name: Name of the folder to create.
+        :return: Response metadata from SharePoint.
+        """
+        url = self._build_url(f"{parent_path}:/children")
+
+        payload = {
+            "name": new_folder_name,
+            "folder": {},
+            "@microsoft.graph.conflictBehavior": "fail",
+        }
+
+        response = self._request("POST", url, json=payload)
+        response.raise_for_status()
+        return _graph_json(response)
+
+    def move_file(
+        self,
+        source_folder: str,
+        file_name: str,
+        dest_folder: str,
+        new_file_name: Optional[str] = None,
+        safe: bool = False,
+    ) -> dict:
+        """
+        Move a file from one folder to another, optionally renaming it.
+
+        The move itself is a single atomic PATCH server-side. With
+        `safe=True`, the move instead runs as a server-side copy followed by
+        deleting the original: no file bytes cross the client and the source
+        is untouched unless the copy completed. Tenants where the copy API is
+        blocked fall back to the older download-a-backup-then-PATCH path.
+
+        :param source_folder: Current folder path .
+        :param file_name: Name of the file to move.
+        :param dest_folder: Destination folder path .
+        :param new_file_name: Optional new name for the file at the destination.
+        :param safe: If True, move via server-side copy + delete so failure
+            can never lose the source file.
+        :return: Metadata of the moved file.
+        """
+        dest_file_name = new_file_name or file_name
+
+        if safe:
+            try:
+                return self._move_by_copy(
+                    source_folder, file_name, dest_folder, dest_file_name
+                )
+            except requests.HTTPError as e:
+                # A destination conflict (409) or missing source (404) is a
+                # real failure either way; the PATCH path is just as doomed.
+                if e.response is not None and e.response.status_code in (404, 409):
+                    raise
+                logger.warning(
+                    f"[SAFE_MOVE_FILE] Server-side copy unavailable ({e}); "
+                    f"falling back to backup-based move",
+                )
+
+        return self._move_by_patch(
+            source_folder, file_name, dest_folder, dest_file_name, backup=safe
+        )
+
+    def _move_by_copy(
+        self, source_folder: str, file_name: str, dest_folder: str, dest_file_name: str
+    ) -> dict:
+        """
+        Move a file via Graph's asynchronous server-side copy, then delete the
+        original once the copy has landed.
+
+        :param source_folder: Current folder path.
+        :param file_name: Name of the file to move.
+        :param dest_folder: Destination folder path.
+        :param dest_file_name: Name for the file at the destination.
+        :return: Metadata of the moved file.
+        """
+        src_path = f"{source_folder}/{file_name}"
+
+        logger.info(
+            f"[SAFE_MOVE_FILE] Copying '{file_name}' server-side to '{dest_folder}/{dest_file_name}'",
+        )
+
+        payload = {
+            "parentReference": {
+                "driveId": self.drive_id,
+                "path": f"/drives/{self.drive_id}/root:/{dest_folder}",
+            },
+            "name": dest_file_name,
+        }
+        copy_response = self._request(
+            "POST", self._build_url(f"{src_path}:/copy"), json=payload
+        )
+        copy_response.raise_for_status()
+
+        # 202 Accepted: poll the (pre-authenticated) monitor URL until the
+        # async copy settles. A completed monitor may redirect straight to
+        # the new item's metadata.
+        monitor_url = copy_response.headers["Location"]
+        deadline = time.monotonic() + _COPY_MONITOR_TIMEOUT
+        while True:
+            monitor_response = self._session.get(monitor_url)
+            monitor_response.raise_for_status()
+            status_body = orjson.loads(monitor_response.content)
+            state = status_body.get("status")
+            if state == "completed" or ("id" in status_body and state is None):
+                break
+            if state == "failed":
+                raise Exception(
+                    f"[SAFE_MOVE_FILE] Server-side copy failed: {status_body.get('error')}",
+                )
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"[SAFE_MOVE_FILE] Server-side copy did not complete within "
+                    f"{_COPY_MONITOR_TIMEOUT}s (last status: {state})",
+                )
+            time.sleep(0.5)
+
+        # The copy landed; removing the original completes the move.
+        delete_response = self._request("DELETE", self._build_url(src_path))
+        delete_response.raise_for_status()
+
+        self._doc_cache.pop((source_folder, file_name), None)
+        self._doc_cache.pop((dest_folder, dest_file_name), None)
+
+        logger.info(
+            f"[SAFE_MOVE_FILE] Successfully moved '{file_name}' to '{dest_folder}/{dest_file_name}'",
+        )
+        return self.get_document(dest_folder, dest_file_name, use_cache=False)
+
+    def _move_by_patch(
+        self,
+        source_folder: str,
+        file_name: str,
+        dest_folder: str,
+        dest_file_name: str,
+        backup: bool = False,
+    ) -> dict:
+        """
+        Move a file with a single path-addressed PATCH, optionally keeping a
+        spooled backup of the content to restore if the move fails.
+
+        :param source_folder: Current folder path.
+        :param file_name: Name of the file to move.
+        :param dest_folder: Destination folder path.
+        :param dest_file_name: Name for the file at the destination.
+        :param backup: If True, download a backup copy before moving.
+        :return: Metadata of the moved file.
+        """
+        src_path = f"{source_folder}/{file_name}"
+
+        file_backup = None  # safeguard in case download fails
+
+        try:
+            logger.info(
+                f"[SAFE_MOVE_FILE] Preparing to move file '{file_name}' from '{source_folder}' to '{dest_folder}' as '{dest_file_name}'",
+            )
+
+            # Step 1 (optional): Stream content into a spooled backup (memory
+            # up to 16 MB, disk beyond) and enforce the size bound as bytes
+            # arrive rather than after buffering the whole file.
+            if backup:
+                max_safe_size = get_dynamic_max_safe_size()
+                spool = tempfile.SpooledTemporaryFile(max_size=16 << 20)
+                with self._request(
+                    "GET",
+                    self._content_url(src_path),
+                    allow_redirects=True,
+                    stream=True,
+                ) as file_response:
+                    file_response.raise_for_status()
+                    downloaded = 0
+                    for chunk in file_response.iter_content(chunk_size=1 << 20):
+                        downloaded += len(chunk)
+                        if downloaded > max_safe_size:
+                            raise MemoryError(
+                                f"[SAFE_MOVE_FILE] File too large to safely move "
+                                f"(> {max_safe_size} bytes)",
+                            )
+                        spool.write(chunk)
+                # Only mark the backup usable once fully downloaded.
+                file_backup = spool
+
+            # Step 2: Move and rename via a single path-addressed PATCH. The
+            # parentReference path spares the item-ID and parent-ID lookups,
+            # and conflictBehavior=fail makes the server reject an existing
+            # destination instead of a pre-check GET.
+            payload = {
+                "parentReference": {
+                    "path": f"/drives/{self.drive_id}/root:/{dest_folder}"
+                },
+                "name": dest_file_name,
+                "@microsoft.graph.conflictBehavior": "fail",
+            }
+
+            move_response = self._request(
+                "PATCH", self._build_url(src_path), json=payload
+            )
+            move_response.raise_for_status()
+
+            # The move invalidates any cached metadata for either endpoint.
+            self._doc_cache.pop((source_folder, file_name), None)
+            self._doc_cache.pop((dest_folder, dest_file_name), None)
+
+            logger.info(
+                f"[SAFE_MOVE_FILE] Successfully moved '{file_name}' to '{dest_folder}/{dest_file_name}'",
+            )
+            return _graph_json(move_response)
+
+        except Exception as e:
+            logger.error(f"[SAFE_MOVE_FILE] Move failed for '{file_name}': {e}")
+
+            # Step 6: Attempt recovery only if file was downloaded
+            if file_backup is not None:
+                try:
+                    recovery_url = self._build_url(src_path + ":/content")
+                    file_backup.seek(0)
+                    recovery_response = self._request(
+                        "PUT",
+                        recovery_url,
+                        headers={"Content-Type": "application/octet-stream"},
+                        data=file_backup,
+                    )
+                    recovery_response.raise_for_status()
+
+                    logger.warning(
+                        f"[SAFE_MOVE_FILE] Recovered original file '{file_name}' to '{source_folder}'",
+                    )
+                except Exception as recover_err:
+                    logger.critical(
+                        f"[SAFE_MOVE_FILE] Failed to recover original file '{file_name}': {recover_err}",
+                    )
+                    raise
+            elif backup:
+                logger.warning(
+                    "[SAFE_MOVE_FILE] Skipped recovery: no backup copy to restore."
+                )
+
+            raise
+
+    def list_drives(self) -> list:
+        """
+        List all drives (document libraries) available under the site.
+
+        :return: List of drives with metadata (id, name, etc.).
+        """
+        url = f"https://graph.microsoft.com/v1.0/sites/{self.site_id}/drives"
+        response = self._request("GET", url)
+        response.raise_for_status()
+        drives = _graph_json(response)["value"]
+        logger.info(f"[DISCOVERY] Found {len(drives)} drives.")
+        return drives
+
+    def list_top_level_folders(self):
+        """
+        List top-level folders in the SharePoint site's document library.
+
+        :return: List of top-level folder names.
+        """
+        url = f"https://graph.microsoft.com/v1.0/sites/{self.site_id}/drives/{self.drive_id}/root/children"
+        response = self._request("GET", url)
+        response.raise_for_status()
+        return [
+            item["name"] for item in _graph_json(response)["value"] if "folder" in item
+        ]
+
+    def _fetch_children(self, folder_path: str) -> list:
+        """
+        Fetch the child items of a folder (returns the raw Graph item dicts).
+
+        :param folder_path: The relative path from the drive root ("" or "/" for root).
+        :return: List of child item metadata dictionaries.
+        """
+        url = self._build_url(
+            "root" if folder_path.strip() in ("", "/") else f"{folder_path}:/children"
+        )
+        response = self._request("GET", url)
+        response.raise_for_status()
+        return _graph_json(response).get("value", [])
+
+    def print_directory(
+        self, folder_path: str, indent: int = 0, show_files: bool = False
+    ):
+        """
+        Prints the folder (and optionally file) structure of a SharePoint directory.
+
+        Folder listings are fetched level-by-level with a bounded thread pool,
+        so wall time scales with tree depth rather than total folder count.
+
+        :param folder_path: The relative path from the drive root
+        :param indent: Starting indentation level
+        :param show_files: Whether to include files in the output
+        """
+        children = {}
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            frontier = [folder_path]
+            while frontier:
+                fetched = pool.map(
+                    lambda path: self._safe_fetch_children(path), frontier
+                )
+                next_frontier = []
+                for path, items in zip(frontier, fetched):
+                    children[path] = items
+                    if isinstance(items, Exception):
+                        continue
+                    for item in items:
+                        if item.get("folder"):
+                            next_frontier.append(
+                                f"{path}/{item['name']}" if path else item["name"]
+                            )
+                frontier = next_frontier
+
+        self._print_tree(folder_path, children, indent, show_files)
+
+    def _safe_fetch_children(self, folder_path: str):
+        """Fetch children, returning the exception instead of raising."""
+        try:
+            return self._fetch_children(folder_path)
+        except Exception as e:
+            return e
+
+    def _print_tree(
+        self, folder_path: str, children: dict, indent: int, show_files: bool
+    ):
+        """
+        Print a prefetched directory tree in the same order as a recursive walk,
+        using an explicit stack so deep hierarchies cost no Python call frames
+        and cannot hit the recursion limit.
+        """
+        stack = [("dir", folder_path, indent)]
+        while stack:
+            entry = stack.pop()
+            if entry[0] == "line":
+                print(entry[1])
+                continue
+
+            _, path, level = entry
+            items = children.get(path, [])
+            if isinstance(items, Exception):
+                print(" " * level + f"[ERROR] {path} - {items}")
+                continue
+
+            frames = []
+            for item in items:
+                if item.get("folder"):
+                    new_path = f"{path}/{item['name']}" if path else item["name"]
+                    frames.append(("line", " " * level + item["name"]))
+                    frames.append(("dir", new_path, level + 4))
+                elif show_files:
+                    frames.append(("line", " " * level + item["name"]))
+            # Reverse so items pop in listing order (LIFO stack).
+            stack.extend(reversed(frames))
+
+
+@functools.lru_cache(maxsize=8)
+def _max_safe_size(fraction: float, _bucket: int) -> int:
+    available_bytes = psutil.virtual_memory().available
+    return int(available_bytes * fraction)
+
+
+def get_dynamic_max_safe_size(fraction: float = 0.2) -> int:
+    """
+    Returns a dynamic max safe size in bytes, based on a fraction of available memory.
+
+    Available memory changes slowly, so the psutil sample (a /proc read on
+    Linux) is cached and refreshed at most every 5 seconds.
+    """
+    return _max_safe_size(fraction, int(time.monotonic() // 5))
+
+
+def list_available_sites():
+    return list(_SITES)
@@ -1,10 +1,20 @@
-import logging
-
-logger = logging.getLogger("wnm_sharepoint_client")
-logger.setLevel(logging.INFO)
-
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger("wnm_sharepoint_client")
+logger.setLevel(logging.INFO)
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    handler.setFormatter(formatter)
+
+    # Log calls enqueue and return immediately; the listener thread does the
+    # blocking stream write, so logging never serializes the thread pools.
+    _log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(_log_queue))
+    _listener = QueueListener(_log_queue, handler)
+    _listener.start()
+    atexit.register(_listener.stop)